@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_ROOT = Path(__file__).parent
+
+# A running server has already imported and initialised Streamlit before the
+# first session arrives, so this scenario warms Streamlit up with a trivial
+# script and reports only the viewer's own first run.
+_FIRST_SESSION = """
+import os, time
+from streamlit.testing.v1 import AppTest
+AppTest.from_string("import streamlit as st; st.title('warm-up')").run()
+app = AppTest.from_file(os.path.abspath("streamlit_app.py"), default_timeout=30)
+start = time.perf_counter()
+app.run()
+print(time.perf_counter() - start)
+"""
+
+SCENARIOS = {
+    "fetch --help": [sys.executable, "fetch_streamlit_blog.py", "--help"],
+    "import collect_blog_links": [sys.executable, "-c", "import collect_blog_links"],
+    "viewer first run (AppTest)": [
+        sys.executable,
+        "-c",
+        "from streamlit.testing.v1 import AppTest; "
+        "AppTest.from_file('streamlit_app.py', default_timeout=30).run()",
+    ],
+    "viewer first session": [sys.executable, "-c", _FIRST_SESSION],
+}
+SELF_TIMED = {"viewer first session"}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments."""
+    parser = argparse.ArgumentParser(
+        description="Time cold starts of the crawler scripts and the viewer."
+    )
+    parser.add_argument(
+        "-n", "--runs", type=int, default=7, help="Fresh processes per scenario."
+    )
+    parser.add_argument(
+        "--ref",
+        help="Git revision to benchmark as a baseline alongside the working tree.",
+    )
+    return parser.parse_args()
+
+
+def export_tree(ref: str, destination: Path) -> None:
+    """Export the files of a git revision into a directory."""
+    archive = subprocess.run(
+        ["git", "archive", ref], cwd=APP_ROOT, check=True, capture_output=True
+    )
+    subprocess.run(
+        ["tar", "-x", "-C", str(destination)], input=archive.stdout, check=True
+    )
+
+
+def time_process(command: list[str], cwd: Path, self_timed: bool = False) -> float:
+    """Run a command in a fresh interpreter and return its time in seconds.
+
+    Self-timed commands print their own duration as the last line of stdout;
+    otherwise the wall time of the whole process is returned.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        command,
+        cwd=cwd,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if self_timed:
+        return float(result.stdout.strip().splitlines()[-1])
+    return elapsed
+
+
+def _format(timings: list[float]) -> str:
+    return (
+        f"median {statistics.median(timings) * 1000:7.1f} ms"
+        f"  best {min(timings) * 1000:7.1f} ms"
+    )
+
+
+def main() -> int:
+    """Print the median and best cold-start time of each scenario."""
+    args = parse_args()
+    if not args.ref:
+        for name, command in SCENARIOS.items():
+            self_timed = name in SELF_TIMED
+            timings = [
+                time_process(command, APP_ROOT, self_timed) for _ in range(args.runs)
+            ]
+            print(f"{name:<28} {_format(timings)}")
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ref_root = Path(tmp)
+        export_tree(args.ref, ref_root)
+        print(f"Baseline {args.ref} vs working tree, {args.runs} runs each:")
+        for name, command in SCENARIOS.items():
+            # Alternate between the trees so drift affects both equally.
+            ref_timings: list[float] = []
+            timings: list[float] = []
+            self_timed = name in SELF_TIMED
+            for _ in range(args.runs):
+                ref_timings.append(time_process(command, ref_root, self_timed))
+                timings.append(time_process(command, APP_ROOT, self_timed))
+            change = statistics.median(timings) / statistics.median(ref_timings) - 1
+            print(f"{name}")
+            print(f"  {args.ref:<10} {_format(ref_timings)}")
+            print(f"  {'current':<10} {_format(timings)}  ({change:+.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
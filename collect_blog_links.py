@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import re
 import sys
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
-
 BASE_URL = "https://streamlit.ghost.io/"
+_ARTICLE_URL_RE = re.compile(r"^https://streamlit\.ghost\.io/[a-z0-9-_]+/?$")
 PAGE_COUNT = 22
 OUTPUT_PATH = Path("article_links.txt")
 
 
+def page_url(page: int) -> str:
+    """Return the URL of a blog listing page."""
+    return BASE_URL if page == 1 else f"{BASE_URL}page/{page}/"
+
+
 def fetch_page(url: str) -> str:
     """Fetch HTML from a URL."""
+    import requests
+
     response = requests.get(url, timeout=20)
     response.raise_for_status()
     return response.text
@@ -22,6 +28,8 @@ def fetch_page(url: str) -> str:
 
 def extract_article_links(html: str) -> list[str]:
     """Extract article links from a page."""
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
     links: list[str] = []
     for anchor in soup.find_all("a", href=True):
@@ -35,7 +43,7 @@ def extract_article_links(html: str) -> list[str]:
         else:
             continue
 
-        if re.match(r"^https://streamlit\.ghost\.io/[a-z0-9-_]+/?$", full):
+        if _ARTICLE_URL_RE.match(full):
             if full.rstrip("/") != BASE_URL.rstrip("/"):
                 links.append(full.rstrip("/"))
     return _unique_preserve_order(links)
@@ -53,13 +61,62 @@ def _unique_preserve_order(items: list[str]) -> list[str]:
     return result
 
 
+async def iter_article_links(
+    page_count: int = PAGE_COUNT,
+    concurrency: int = 4,
+    on_error: Callable[[str, Exception], None] | None = None,
+) -> AsyncIterator[str]:
+    """Fetch listing pages concurrently, yielding new links as pages arrive.
+
+    Pages that fail to fetch are skipped and passed to `on_error` with their
+    URL, or logged as warnings if no callback is given.
+    """
+    import asyncio
+    import logging
+
+    import requests
+
+    logger = logging.getLogger(__name__)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(url: str) -> str | None:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(fetch_page, url)
+            except requests.RequestException as exc:
+                if on_error is None:
+                    logger.warning("Could not fetch %s: %s", url, exc)
+                else:
+                    on_error(url, exc)
+                return None
+
+    seen: set[str] = set()
+    pages = [
+        asyncio.create_task(fetch(page_url(page)))
+        for page in range(1, page_count + 1)
+    ]
+    try:
+        for next_page in asyncio.as_completed(pages):
+            html = await next_page
+            if html is None:
+                continue
+            for link in extract_article_links(html):
+                if link in seen:
+                    continue
+                seen.add(link)
+                yield link
+    finally:
+        for task in pages:
+            task.cancel()
+
+
 def main() -> int:
     """Collect blog links across all pages."""
     all_links: list[str] = []
     mismatches: list[str] = []
     for page in range(1, PAGE_COUNT + 1):
-        url = BASE_URL if page == 1 else f"{BASE_URL}page/{page}/"
-        html = fetch_page(url)
+        html = fetch_page(page_url(page))
         links = extract_article_links(html)
 
         if page == 1:
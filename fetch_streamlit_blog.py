@@ -4,14 +4,41 @@ import argparse
 import json
 import re
 import sys
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup, Tag
-from markdownify import markdownify as md
+from near_duplicates import (
+    ARTICLES_DIR,
+    article_signatures,
+    build_index,
+    store_signature,
+    strip_frontmatter,
+)
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
+# requests, bs4 and markdownify are imported where they are used so that
+# `--help` and importing this module for its helpers stay fast.
+
+_AUTHOR_HREF_RE = re.compile(r"/author/")
+_TAG_HREF_RE = re.compile(r"/tag/")
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+@dataclass(frozen=True, eq=False)
+class Article:
+    url: str
+    title: str
+    subtitle: str | None
+    date: str
+    authors: list[str]
+    category: str | None
+    markdown: str
 
 
 def parse_args() -> argparse.Namespace:
@@ -20,6 +47,11 @@ def parse_args() -> argparse.Namespace:
         description="Fetch a Streamlit Ghost blog article and save as Markdown."
     )
     parser.add_argument("url", help="Streamlit Ghost blog article URL")
+    parser.add_argument(
+        "--skip-duplicates",
+        action="store_true",
+        help="Do not write the article if it near-duplicates an existing one.",
+    )
     return parser.parse_args()
 
 
@@ -34,6 +66,8 @@ def validate_streamlit_ghost_url(url: str) -> None:
 
 def fetch_html(url: str) -> str:
     """Fetch HTML from a URL."""
+    import requests
+
     response = requests.get(url, timeout=20)
     response.raise_for_status()
     return response.text
@@ -198,10 +232,10 @@ def _remove_meta_blocks(root: Tag, subtitle: str | None) -> None:
     """Remove author/tag metadata blocks inside the content."""
     for tag in root.find_all(["p", "div", "span"]):
         text = _normalize_text(tag.get_text(" ", strip=True))
-        if text.startswith("by ") and tag.find("a", href=re.compile(r"/author/")):
+        if text.startswith("by ") and tag.find("a", href=_AUTHOR_HREF_RE):
             tag.decompose()
             continue
-        if "posted in" in text and tag.find("a", href=re.compile(r"/tag/")):
+        if "posted in" in text and tag.find("a", href=_TAG_HREF_RE):
             tag.decompose()
             continue
         if subtitle and _normalize_text(subtitle) == text:
@@ -210,6 +244,8 @@ def _remove_meta_blocks(root: Tag, subtitle: str | None) -> None:
 
 def _remove_sections_by_heading(root: Tag, titles: set[str]) -> None:
     """Remove sections by heading title, including following siblings."""
+    from bs4 import Tag
+
     for heading in list(root.find_all(["h1", "h2", "h3", "h4"])):
         heading_text = _normalize_text(heading.get_text(" ", strip=True))
         if heading_text not in titles:
@@ -300,7 +336,7 @@ def _unique_non_empty(values: list[str]) -> list[str]:
 
 def slugify(text: str) -> str:
     """Convert text to a filesystem-safe slug."""
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", text.strip().lower())
+    slug = _SLUG_SEPARATOR_RE.sub("-", text.strip().lower())
     return slug.strip("-") or "article"
 
 
@@ -313,6 +349,8 @@ def render_markdown(
     html: str,
 ) -> str:
     """Render final Markdown content."""
+    from markdownify import markdownify as md
+
     body = md(html, heading_style="ATX").strip()
     frontmatter = _build_frontmatter(
         title=title,
@@ -353,39 +391,156 @@ def _build_frontmatter(
     return "\n".join(lines)
 
 
+def article_path(title: str, date_str: str) -> Path:
+    """Return the articles directory path for an article."""
+    return ARTICLES_DIR / f"{date_str}-{slugify(title)}.md"
+
+
+def find_near_duplicates(output_path: Path, markdown: str) -> list[str]:
+    """Return stems of existing articles whose body near-duplicates markdown."""
+    index = build_index(
+        {
+            stem: signature
+            for stem, signature in article_signatures().items()
+            if stem != output_path.stem
+        }
+    )
+    return [match.key for match in index.query(strip_frontmatter(markdown))]
+
+
 def write_markdown_file(title: str, date_str: str, markdown: str) -> Path:
     """Write Markdown to the articles directory."""
-    output_dir = Path("articles")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    filename = f"{date_str}-{slugify(title)}.md"
-    output_path = output_dir / filename
+    output_path = article_path(title, date_str)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(markdown, encoding="utf-8")
+    store_signature(output_path, strip_frontmatter(markdown))
     return output_path
 
 
+def parse_article(url: str, html: str) -> Article:
+    """Parse article HTML into an Article with rendered Markdown."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    title = extract_title(soup)
+    subtitle = extract_subtitle(soup)
+    date_str = extract_publish_date(soup)
+    authors = extract_authors(soup)
+    category = extract_category(soup)
+    content_html = extract_content(soup, title, subtitle)
+    markdown = render_markdown(
+        title=title,
+        subtitle=subtitle,
+        date_str=date_str,
+        authors=authors,
+        category=category,
+        html=content_html,
+    )
+    return Article(
+        url=url,
+        title=title,
+        subtitle=subtitle,
+        date=date_str,
+        authors=authors,
+        category=category,
+        markdown=markdown,
+    )
+
+
+def fetch_article(url: str) -> Article:
+    """Validate, fetch and parse a single article."""
+    validate_streamlit_ghost_url(url)
+    return parse_article(url, fetch_html(url))
+
+
+async def fetch_articles(
+    urls: Iterable[str] | AsyncIterable[str],
+    concurrency: int = 8,
+    on_error: Callable[[str, Exception], None] | None = None,
+) -> AsyncIterator[Article]:
+    """Fetch articles concurrently, yielding each one as soon as it is parsed.
+
+    Articles are yielded in completion order, not input order. URLs may come
+    from an async iterable (e.g. link collection) and are scheduled as they
+    arrive. At most `concurrency` parsed articles wait for the consumer, so a
+    slow consumer throttles fetching. Articles that fail to fetch or parse are
+    skipped and passed to `on_error` with their URL, or logged as warnings if
+    no callback is given.
+    """
+    import asyncio
+    import logging
+
+    import requests
+
+    logger = logging.getLogger(__name__)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    queue: asyncio.Queue[Article] = asyncio.Queue(maxsize=concurrency)
+
+    async def worker(url: str) -> None:
+        async with semaphore:
+            try:
+                article = await asyncio.to_thread(fetch_article, url)
+            except (requests.RequestException, ValueError) as exc:
+                if on_error is None:
+                    logger.warning("Could not fetch %s: %s", url, exc)
+                else:
+                    on_error(url, exc)
+                return
+            await queue.put(article)
+
+    async def schedule() -> None:
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            if isinstance(urls, AsyncIterable):
+                async for url in urls:
+                    tasks.append(asyncio.create_task(worker(url)))
+            else:
+                for url in urls:
+                    tasks.append(asyncio.create_task(worker(url)))
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    scheduler = asyncio.create_task(schedule())
+    try:
+        while True:
+            getter = asyncio.create_task(queue.get())
+            await asyncio.wait(
+                {getter, scheduler}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not getter.done():
+                getter.cancel()
+                break
+            yield getter.result()
+
+        # Every worker has queued its article once the scheduler is done.
+        while not queue.empty():
+            yield queue.get_nowait()
+        await scheduler
+    finally:
+        scheduler.cancel()
+
+
 def main() -> int:
     """CLI entrypoint."""
     args = parse_args()
+    import requests
+
     try:
-        validate_streamlit_ghost_url(args.url)
-        html = fetch_html(args.url)
-        soup = BeautifulSoup(html, "html.parser")
-        title = extract_title(soup)
-        subtitle = extract_subtitle(soup)
-        date_str = extract_publish_date(soup)
-        authors = extract_authors(soup)
-        category = extract_category(soup)
-        content_html = extract_content(soup, title, subtitle)
-        markdown = render_markdown(
-            title=title,
-            subtitle=subtitle,
-            date_str=date_str,
-            authors=authors,
-            category=category,
-            html=content_html,
+        article = fetch_article(args.url)
+        duplicates = find_near_duplicates(
+            article_path(article.title, article.date), article.markdown
+        )
+        for duplicate in duplicates:
+            print(f"Near-duplicate of {duplicate}", file=sys.stderr)
+        if duplicates and args.skip_duplicates:
+            print("Skipped writing near-duplicate article.", file=sys.stderr)
+            return 0
+        output_path = write_markdown_file(
+            article.title, article.date, article.markdown
         )
-        output_path = write_markdown_file(title, date_str, markdown)
     except (requests.RequestException, ValueError) as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
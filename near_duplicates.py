@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+NUM_PERMUTATIONS = 128
+BANDS = 32
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.7
+
+APP_ROOT = Path(__file__).parent
+ARTICLES_DIR = APP_ROOT / "articles"
+SIGNATURES_PATH = APP_ROOT / "article_signatures.jsonl"
+
+logger = logging.getLogger(__name__)
+
+_MAX_HASH = (1 << 32) - 1
+_WORD_RE = re.compile(r"\w+")
+_LINK_TARGET_RE = re.compile(r"\]\([^)]*\)")
+_FRONTMATTER_RE = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+
+
+def strip_frontmatter(markdown: str) -> str:
+    """Return the Markdown body without its YAML frontmatter."""
+    return _FRONTMATTER_RE.sub("", markdown, count=1)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Split text into overlapping word n-grams, ignoring link targets."""
+    words = _WORD_RE.findall(_LINK_TARGET_RE.sub("]", text).lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return set(map(" ".join, zip(*(words[i:] for i in range(size)))))
+
+
+def minhash_signature(text: str) -> tuple[int, ...]:
+    """Compute a one-permutation MinHash signature of a text's shingle set.
+
+    Each shingle is hashed once and assigned to one of NUM_PERMUTATIONS bins by
+    its hash; the signature holds the minimum hash per bin. Empty bins borrow
+    the value of the next non-empty bin so that signatures stay comparable.
+    Text without any words gets an empty signature, which never matches.
+    """
+    signature = [_MAX_HASH] * NUM_PERMUTATIONS
+    for value in map(zlib.crc32, map(str.encode, shingles(text))):
+        bin_idx = value % NUM_PERMUTATIONS
+        if value < signature[bin_idx]:
+            signature[bin_idx] = value
+
+    filled = [i for i, value in enumerate(signature) if value != _MAX_HASH]
+    if not filled:
+        return ()
+    if len(filled) == NUM_PERMUTATIONS:
+        return tuple(signature)
+    for i in range(NUM_PERMUTATIONS):
+        if signature[i] == _MAX_HASH:
+            donor = next((j for j in filled if j > i), filled[0])
+            signature[i] = signature[donor]
+    return tuple(signature)
+
+
+def estimate_similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    if not left or not right:
+        return 0.0
+    matches = sum(1 for x, y in zip(left, right) if x == y)
+    return matches / len(left)
+
+
+def body_digest(body: str) -> str:
+    """Return a short digest of an article body, ignoring outer whitespace."""
+    return f"{zlib.crc32(body.strip().encode('utf-8')):08x}"
+
+
+@dataclass(frozen=True)
+class Match:
+    key: str
+    similarity: float
+
+
+@dataclass(frozen=True)
+class SignatureRecord:
+    digest: str
+    signature: tuple[int, ...]
+
+
+class MinHashIndex:
+    """Locality-sensitive hashing index over MinHash signatures.
+
+    Signatures are split into bands; two texts become candidates when any
+    band collides, so a query only compares against a handful of entries
+    instead of the whole archive.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._rows = NUM_PERMUTATIONS // BANDS
+        self._buckets: list[dict[tuple[int, ...], list[str]]] = [
+            {} for _ in range(BANDS)
+        ]
+        self._signatures: dict[str, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        rows = self._rows
+        return [signature[i * rows : (i + 1) * rows] for i in range(BANDS)]
+
+    def add(self, key: str, text: str) -> None:
+        """Add a text to the index under key."""
+        self.add_signature(key, minhash_signature(text))
+
+    def add_signature(self, key: str, signature: tuple[int, ...]) -> None:
+        """Add a precomputed signature to the index under key.
+
+        Empty signatures are ignored so that bodies without text never match.
+        """
+        if not signature:
+            return
+        self._signatures[key] = signature
+        for bucket, band in zip(self._buckets, self._bands(signature)):
+            bucket.setdefault(band, []).append(key)
+
+    def query(self, text: str) -> list[Match]:
+        """Return indexed entries whose similarity to text meets the threshold."""
+        return self.query_signature(minhash_signature(text))
+
+    def query_signature(self, signature: tuple[int, ...]) -> list[Match]:
+        """Return indexed entries whose similarity to signature meets the threshold."""
+        if not signature:
+            return []
+
+        candidates: set[str] = set()
+        for bucket, band in zip(self._buckets, self._bands(signature)):
+            candidates.update(bucket.get(band, ()))
+
+        matches = [
+            Match(key, estimate_similarity(signature, self._signatures[key]))
+            for key in candidates
+        ]
+        matches = [m for m in matches if m.similarity >= self.threshold]
+        return sorted(matches, key=lambda m: (-m.similarity, m.key))
+
+
+def build_index(
+    signatures: dict[str, tuple[int, ...]], threshold: float = DEFAULT_THRESHOLD
+) -> MinHashIndex:
+    """Index precomputed signatures by key."""
+    index = MinHashIndex(threshold)
+    for key, signature in signatures.items():
+        index.add_signature(key, signature)
+    return index
+
+
+def group_duplicates(
+    signatures: dict[str, tuple[int, ...]], threshold: float = DEFAULT_THRESHOLD
+) -> dict[str, str]:
+    """Map each near-duplicate key to the first key (in input order) it matches.
+
+    Keys without a near-duplicate earlier in the input are omitted.
+    """
+    index = MinHashIndex(threshold)
+    canonical: dict[str, str] = {}
+    for key, signature in signatures.items():
+        matches = index.query_signature(signature)
+        if matches:
+            first = matches[0].key
+            canonical[key] = canonical.get(first, first)
+        index.add_signature(key, signature)
+    return canonical
+
+
+def signature_record(body: str) -> SignatureRecord:
+    """Compute the stored record for an article body."""
+    return SignatureRecord(digest=body_digest(body), signature=minhash_signature(body))
+
+
+def load_signatures(path: Path = SIGNATURES_PATH) -> dict[str, SignatureRecord]:
+    """Load stored signatures keyed by article file stem."""
+    records: dict[str, SignatureRecord] = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        logger.warning("Signature store %s is missing; hashing all articles.", path)
+        return records
+    except OSError as exc:
+        logger.warning("Could not read signature store %s: %s", path, exc)
+        return records
+
+    skipped = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+            raw = bytes.fromhex(row["signature"])
+            signature = struct.unpack(f">{len(raw) // 4}I", raw)
+            records[Path(row["file"]).stem] = SignatureRecord(
+                digest=row["digest"], signature=signature
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, struct.error):
+            skipped += 1
+    if skipped:
+        logger.warning("Skipped %d malformed rows in %s.", skipped, path)
+    return records
+
+
+def write_signatures(
+    records: dict[str, SignatureRecord], path: Path = SIGNATURES_PATH
+) -> None:
+    """Rewrite the signature store with one row per article, sorted by file."""
+    rows = [
+        json.dumps(
+            {
+                "file": f"{ARTICLES_DIR.name}/{stem}.md",
+                "digest": record.digest,
+                "signature": "".join(f"{value:08x}" for value in record.signature),
+            },
+            separators=(",", ":"),
+        )
+        for stem, record in sorted(records.items())
+    ]
+    path.write_text("".join(f"{row}\n" for row in rows), encoding="utf-8")
+
+
+def store_signature(
+    article_path: Path, body: str, path: Path = SIGNATURES_PATH
+) -> None:
+    """Record the signature of a written article, replacing any earlier row."""
+    records = load_signatures(path)
+    records[article_path.stem] = signature_record(body)
+    write_signatures(records, path)
+
+
+def article_signatures(
+    articles_dir: Path = ARTICLES_DIR,
+    path: Path = SIGNATURES_PATH,
+    verify: bool = True,
+) -> dict[str, tuple[int, ...]]:
+    """Return the signature of every article in a directory, keyed by file stem.
+
+    Stored signatures are reused and articles missing from the store are
+    hashed. With `verify`, every body is also read and re-hashed if its digest
+    no longer matches the store, which catches articles edited in place.
+    Any change is written back to the store.
+    """
+    stored = load_signatures(path)
+    current: dict[str, SignatureRecord] = {}
+    changed = False
+    for article_path in sorted(articles_dir.glob("*.md")):
+        record = stored.get(article_path.stem)
+        if record is None or verify:
+            try:
+                markdown = article_path.read_text(encoding="utf-8")
+            except OSError:
+                continue
+            body = strip_frontmatter(markdown)
+            if record is None or record.digest != body_digest(body):
+                record = signature_record(body)
+                changed = True
+        current[article_path.stem] = record
+
+    if changed or current.keys() != stored.keys():
+        try:
+            write_signatures(current, path)
+        except OSError as exc:
+            logger.warning("Could not update signature store %s: %s", path, exc)
+    return {stem: record.signature for stem, record in current.items()}
+
+
+def main() -> int:
+    """Rebuild the signature store from the articles directory."""
+    records: dict[str, SignatureRecord] = {}
+    for article_path in sorted(ARTICLES_DIR.glob("*.md")):
+        markdown = article_path.read_text(encoding="utf-8")
+        records[article_path.stem] = signature_record(strip_frontmatter(markdown))
+    write_signatures(records)
+    print(f"Wrote {SIGNATURES_PATH} with {len(records)} signatures.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import json
 from pathlib import Path
 import re
 from typing import Any
 
 import streamlit as st
 
-APP_ROOT = Path(__file__).parent
-ARTICLES_DIR = APP_ROOT / "articles"
+from near_duplicates import (
+    APP_ROOT,
+    ARTICLES_DIR,
+    article_signatures,
+    group_duplicates,
+)
+
+INDEX_PATH = APP_ROOT / "article_index.jsonl"
+POSTS_VERSION = "v3"
+_FRONTMATTER_KEY_RE = re.compile(r"^([A-Za-z0-9_-]+):\s*(.*)$")
 
 
 @dataclass(frozen=True, eq=False)
@@ -33,6 +42,13 @@ class Post:
         return ", ".join(self.authors) if self.authors else ""
 
 
+@dataclass(frozen=True)
+class PostSummary:
+    id: str
+    title: str
+    date: str | None
+
+
 def _strip_quotes(value: str) -> str:
     if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
         return value[1:-1]
@@ -53,7 +69,7 @@ def _parse_frontmatter(text: str) -> dict[str, Any]:
         if not line.strip():
             continue
 
-        match = re.match(r"^([A-Za-z0-9_-]+):\s*(.*)$", line)
+        match = _FRONTMATTER_KEY_RE.match(line)
         if match:
             key, raw_value = match.group(1), match.group(2)
             if raw_value == "":
@@ -119,17 +135,59 @@ def _post_from_file(path: Path) -> Post | None:
     )
 
 
+def _load_index_rows() -> dict[str, PostSummary]:
+    try:
+        lines = INDEX_PATH.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+
+    summaries: dict[str, PostSummary] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+            post_id = Path(row["file"]).stem
+        except (json.JSONDecodeError, KeyError, TypeError):
+            continue
+        summaries[post_id] = PostSummary(
+            id=post_id,
+            title=str(row.get("title") or post_id),
+            date=row.get("date"),
+        )
+    return summaries
+
+
 @st.cache_data(show_spinner=False)
-def load_posts(version: str) -> list[Post]:
-    posts: list[Post] = []
+def load_post_index(version: str) -> list[PostSummary]:
+    # The picker only needs titles and dates, so take them from the article
+    # index and parse just the articles that are not indexed yet.
+    indexed = _load_index_rows()
+    summaries: list[PostSummary] = []
     for path in sorted(ARTICLES_DIR.glob("*.md")):
-        post = _post_from_file(path)
-        if post:
-            posts.append(post)
-    return posts
+        summary = indexed.get(path.stem)
+        if summary is None:
+            post = _post_from_file(path)
+            if post is None:
+                continue
+            summary = PostSummary(id=path.stem, title=post.title, date=post.date)
+        summaries.append(summary)
+    return summaries
+
+
+@st.cache_data(show_spinner=False)
+def load_post(post_id: str, version: str) -> Post | None:
+    return _post_from_file(ARTICLES_DIR / f"{post_id}.md")
 
 
-def _sort_posts(posts: list[Post]) -> list[Post]:
+@st.cache_data(show_spinner=False)
+def load_duplicates(version: str) -> dict[str, str]:
+    # Trust stored signatures instead of reading every body; only articles
+    # missing from the store are hashed.
+    return group_duplicates(article_signatures(ARTICLES_DIR, verify=False))
+
+
+def _sort_posts(posts: list[PostSummary]) -> list[PostSummary]:
     return sorted(posts, key=lambda p: p.date or "", reverse=True)
 
 
@@ -177,17 +235,19 @@ def _render_frontmatter(post: Post) -> None:
 def main() -> None:
     st.set_page_config(
         page_title="Streamlit Blog Viewer",
-        page_icon="🗂️",
+        page_icon=":material/folder_open:",
     )
 
     st.title("Streamlit blog viewer")
     st.caption("Pick a post and read it with frontmatter details.")
 
-    posts = _sort_posts(load_posts("v2"))
-    post_ids = [post.path.stem for post in posts]
-    post_by_id = {post.path.stem: post for post in posts}
+    duplicates = load_duplicates(POSTS_VERSION)
+    all_posts = _sort_posts(load_post_index(POSTS_VERSION))
+    posts = [post for post in all_posts if post.id not in duplicates]
+    post_ids = [post.id for post in posts]
+    post_by_id = {post.id: post for post in posts}
 
-    def label(post: Post) -> str:
+    def label(post: PostSummary) -> str:
         date_prefix = post.date or "Unknown date"
         return f"{date_prefix} — {post.title}"
 
@@ -195,14 +255,15 @@ def main() -> None:
     if isinstance(raw_param, list):
         raw_param = raw_param[0] if raw_param else None
 
+    raw_param = duplicates.get(raw_param, raw_param)
     selected_id = raw_param if raw_param in post_by_id else post_ids[0]
 
     if st.query_params.get("post") != selected_id:
         st.query_params["post"] = selected_id
 
     def sync_query_params() -> None:
-        selected_post: Post = st.session_state["post_select"]
-        st.query_params["post"] = selected_post.path.stem
+        selected_post: PostSummary = st.session_state["post_select"]
+        st.query_params["post"] = selected_post.id
 
     selected = st.selectbox(
         "Post",
@@ -214,8 +275,21 @@ def main() -> None:
         on_change=sync_query_params,
     )
 
-    _render_frontmatter(selected)
-    st.markdown(selected.body)
+    post = load_post(selected.id, POSTS_VERSION)
+    if post is None:
+        st.error(f"Could not read {selected.id}.")
+        return
+
+    _render_frontmatter(post)
+    st.markdown(post.body)
+
+    for summary in all_posts:
+        if duplicates.get(summary.id) != selected.id:
+            continue
+        duplicate = load_post(summary.id, POSTS_VERSION)
+        if duplicate:
+            with st.expander(f"Near-duplicate: {label(summary)}"):
+                st.markdown(duplicate.body)
 
 
 if __name__ == "__main__":